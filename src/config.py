@@ -2,6 +2,7 @@
 
 import os
 import logging
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
@@ -171,6 +172,18 @@ def load_config(env_file: Optional[Path] = None) -> Config:
         raise ConfigError(f"Failed to load configuration: {e}")
 
 
+# File currently being processed by this thread/context, shown in every log line
+current_file: ContextVar[str] = ContextVar("current_file", default="-")
+
+
+class CurrentFileFilter(logging.Filter):
+    """Inject the file currently being processed into log records."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        setattr(record, "current_file", current_file.get())
+        return True
+
+
 def setup_logging(config: Config) -> None:
     """
     Set up logging based on configuration.
@@ -183,7 +196,7 @@ def setup_logging(config: Config) -> None:
 
     # Create formatters
     formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        fmt="%(asctime)s - %(name)s - %(levelname)s - %(current_file)s %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
@@ -199,6 +212,7 @@ def setup_logging(config: Config) -> None:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
+    console_handler.addFilter(CurrentFileFilter())
     root_logger.addHandler(console_handler)
 
     # File handler (if specified)
@@ -210,6 +224,7 @@ def setup_logging(config: Config) -> None:
             file_handler = logging.FileHandler(config.log_file)
             file_handler.setLevel(log_level)
             file_handler.setFormatter(formatter)
+            file_handler.addFilter(CurrentFileFilter())
             root_logger.addHandler(file_handler)
 
             logging.info(f"Logging to file: {config.log_file}")
@@ -4,17 +4,23 @@ import logging
 import time
 import uuid
 from pathlib import Path
+from queue import Empty, Queue
 from typing import List, Set, Callable, Optional, Dict
-from threading import Thread, Event, Lock
+from threading import Thread, Event, Lock, Timer
 from dataclasses import dataclass
 
 from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
+from .config import current_file
 from .transcriber import AudioTranscriber
 
 logger = logging.getLogger(__name__)
 
+# Quiet period (seconds) after the last event before a file is processed
+DEFAULT_DEBOUNCE_DELAY = 0.5
+
 
 @dataclass
 class ProcessedFile:
@@ -30,18 +36,36 @@ class ProcessedFile:
 class AudioFileHandler(FileSystemEventHandler):
     """Handles file system events for audio files."""
 
-    def __init__(self, transcriber: AudioTranscriber, callback: Callable[[Path], None]):
+    def __init__(
+        self,
+        transcriber: AudioTranscriber,
+        callback: Callable[[Path], None],
+        debounce_delay: float = 0.0,
+        timer_factory: Callable[..., Timer] = Timer,
+    ):
         """
         Initialize the audio file handler.
 
         Args:
             transcriber: AudioTranscriber instance to check file compatibility
             callback: Function to call when a new audio file is detected
+            debounce_delay: Seconds of quiet to wait for before calling back;
+                0 calls back immediately on every event
+            timer_factory: Factory for the debounce timers (for tests)
         """
         super().__init__()
         self.transcriber = transcriber
         self.callback = callback
         self.processing_files: Set[str] = set()
+        self.debounce_delay = debounce_delay
+        self._timer_factory = timer_factory
+        self._pending: Dict[str, Timer] = {}  # file_path -> debounce timer
+        self._pending_lock = Lock()  # guards _pending, _stopped and processing_files
+        self._stopped = False  # set by cancel_pending(); late timers then do nothing
+
+        # Expired timers only enqueue; one worker calls back, one file at a time
+        self._queue: Queue[Optional[Path]] = Queue()
+        self._worker: Optional[Thread] = None
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation events."""
@@ -62,8 +86,9 @@ class AudioFileHandler(FileSystemEventHandler):
         """
         # Skip if already processing this file
         file_key = str(file_path)
-        if file_key in self.processing_files:
-            return
+        with self._pending_lock:
+            if file_key in self.processing_files:
+                return
 
         # Skip if not a supported audio file
         if not self.transcriber.is_supported_file(file_path):
@@ -75,17 +100,114 @@ class AudioFileHandler(FileSystemEventHandler):
             logger.debug(f"Skipping temporary file: {file_path}")
             return
 
-        logger.info(f"New audio file detected: {file_path}")
+        if self.debounce_delay > 0:
+            self._schedule(file_path)
+        else:
+            self._dispatch(file_path)
+
+    def _schedule(self, file_path: Path) -> None:
+        """
+        (Re)start the debounce timer for a file.
+
+        Args:
+            file_path: Path to the file that was created or modified
+        """
+        file_key = str(file_path)
+        with self._pending_lock:
+            if self._stopped:
+                return
+
+            previous = self._pending.get(file_key)
+            if previous is not None:
+                previous.cancel()
+
+            timer = self._timer_factory(
+                self.debounce_delay, self._fire, args=(file_path,)
+            )
+            timer.daemon = True
+            self._pending[file_key] = timer
+            timer.start()
+
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = Thread(target=self._drain_queue, daemon=True)
+                self._worker.start()
+
+    def _fire(self, file_path: Path) -> None:
+        """Handle a debounce timer expiring without further events."""
+        with self._pending_lock:
+            self._pending.pop(str(file_path), None)
+            # A timer already running when stop() cancelled it must not enqueue
+            if self._stopped:
+                return
+            self._queue.put(file_path)
+
+    def _drain_queue(self) -> None:
+        """Worker loop dispatching settled files until a None sentinel arrives."""
+        while True:
+            file_path = self._queue.get()
+            try:
+                if file_path is None:
+                    return
+                self._dispatch(file_path)
+            except Exception as e:
+                logger.error(f"Error handling {file_path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _dispatch(self, file_path: Path) -> None:
+        """
+        Hand a settled audio file to the callback.
+
+        Args:
+            file_path: Path to the audio file to process
+        """
+        file_key = str(file_path)
+        with self._pending_lock:
+            if file_key in self.processing_files:
+                return
 
-        # Mark as processing to avoid duplicates
-        self.processing_files.add(file_key)
+            # Mark as processing to avoid duplicates
+            self.processing_files.add(file_key)
+
+        logger.info(f"New audio file detected: {file_path}")
 
         try:
             # Call the callback to process the file
             self.callback(file_path)
         finally:
             # Remove from processing set
-            self.processing_files.discard(file_key)
+            with self._pending_lock:
+                self.processing_files.discard(file_key)
+
+    def cancel_pending(self) -> None:
+        """Cancel all debounce timers that have not fired yet and accept no more."""
+        with self._pending_lock:
+            self._stopped = True
+            for timer in self._pending.values():
+                timer.cancel()
+            self._pending.clear()
+
+    def stop(self) -> None:
+        """
+        Drop files still waiting to be handled and wait for the current one.
+
+        Cancels unfired debounce timers, discards settled files the worker
+        has not started on, and joins the worker so an in-flight callback
+        finishes before this returns.
+        """
+        self.cancel_pending()
+
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                break
+            self._queue.task_done()
+
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
 
 
 class FolderMonitor:
@@ -98,6 +220,7 @@ class FolderMonitor:
         done_dir: Path,
         transcriber: AudioTranscriber,
         poll_interval: int = 5,
+        debounce_delay: float = DEFAULT_DEBOUNCE_DELAY,
     ):
         """
         Initialize the folder monitor.
@@ -108,6 +231,8 @@ class FolderMonitor:
             done_dir: Directory to move processed files
             transcriber: AudioTranscriber instance
             poll_interval: Polling interval in seconds for fallback monitoring
+            debounce_delay: Seconds to wait after the last file system event
+                for a file before processing it
         """
         self.input_dir = input_dir
         self.output_dir = output_dir
@@ -120,9 +245,11 @@ class FolderMonitor:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.done_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set up watchdog observer
-        self.observer = Observer()
-        self.event_handler = AudioFileHandler(transcriber, self._process_file)
+        # Watchdog observer is created on first use, see the observer property
+        self._observer: Optional[BaseObserver] = None
+        self.event_handler = AudioFileHandler(
+            transcriber, self._process_file, debounce_delay=debounce_delay
+        )
 
         # Threading controls
         self._stop_event = Event()
@@ -140,6 +267,13 @@ class FolderMonitor:
         logger.info(f"  Output directory: {self.output_dir}")
         logger.info(f"  Done directory: {self.done_dir}")
 
+    @property
+    def observer(self) -> BaseObserver:
+        """Watchdog observer, created lazily so unstarted monitors skip the setup."""
+        if self._observer is None:
+            self._observer = Observer()
+        return self._observer
+
     def start(self) -> None:
         """Start monitoring the input directory."""
         logger.info("Starting folder monitoring...")
@@ -162,11 +296,15 @@ class FolderMonitor:
         logger.info("Stopping folder monitoring...")
 
         # Stop the observer
-        if self.observer.is_alive():
+        if self._observer is not None and self._observer.is_alive():
             self.observer.stop()
             self.observer.join()
             logger.info("File system watcher stopped")
 
+        # Drop files still waiting out their debounce period and wait for
+        # the one being processed, as observer.join() does for direct events
+        self.event_handler.stop()
+
         # Stop polling thread
         self._stop_event.set()
         if self._poll_thread and self._poll_thread.is_alive():
@@ -200,12 +338,11 @@ class FolderMonitor:
                     if file_path.is_file() and self.transcriber.is_supported_file(
                         file_path
                     ):
-                        # If transcript doesn't exist, process the file (even if recently processed)
-                        # If transcript exists, only process if not recently processed
-                        transcript_exists = self._already_has_transcript(file_path)
-                        recently_processed = self._is_recently_processed(file_path)
-
-                        should_process = not transcript_exists or not recently_processed
+                        # Process files not recently processed; for recent ones, only
+                        # if the transcript is missing (so only they cost a stat)
+                        should_process = not self._is_recently_processed(
+                            file_path
+                        ) or not self._already_has_transcript(file_path)
                         if should_process:
                             logger.debug(f"Polling detected file: {file_path}")
                             self._process_file(file_path)
@@ -262,61 +399,67 @@ class FolderMonitor:
         file_key = str(file_path)
         processing_id = str(uuid.uuid4())[:8]  # Short unique ID
 
-        # Check if already being processed (race condition protection)
-        with self._processing_lock:
-            if file_key in self._currently_processing:
-                existing_id = self._currently_processing[file_key]
-                logger.info(
-                    f"File already being processed by {existing_id}, skipping: {file_path.name}"
-                )
-                return
-
-            # Mark as being processed
-            self._currently_processing[file_key] = processing_id
-
-        logger.info(f"[{processing_id}] Processing file: {file_path}")
-
+        # Tag every log line emitted while handling this file with its path
+        token = current_file.set(file_key)
         try:
-            # Check if file still exists (might have been moved/deleted)
-            if not file_path.exists():
-                logger.warning(f"[{processing_id}] File no longer exists: {file_path}")
-                return
+            # Check if already being processed (race condition protection)
+            with self._processing_lock:
+                if file_key in self._currently_processing:
+                    existing_id = self._currently_processing[file_key]
+                    logger.info(
+                        f"File already being processed by {existing_id}, skipping"
+                    )
+                    return
 
-            # Wait a moment to ensure file is fully written
-            self._wait_for_file_stability(file_path)
+                # Mark as being processed
+                self._currently_processing[file_key] = processing_id
 
-            # Generate output path
-            output_path = self.output_dir / f"{file_path.stem}.txt"
+            logger.info(f"[{processing_id}] Processing file")
 
-            # Check if transcript already exists
-            if output_path.exists():
-                logger.info(
-                    f"[{processing_id}] Transcript already exists, skipping: {output_path}"
-                )
+            try:
+                # Check if file still exists (might have been moved/deleted)
+                if not file_path.exists():
+                    logger.warning(f"[{processing_id}] File no longer exists")
+                    return
+
+                # Wait a moment to ensure file is fully written
+                self._wait_for_file_stability(file_path)
+
+                # Generate output path
+                output_path = self.output_dir / f"{file_path.stem}.txt"
+
+                # Check if transcript already exists
+                if output_path.exists():
+                    logger.info(
+                        f"[{processing_id}] Transcript already exists, "
+                        f"skipping: {output_path}"
+                    )
+                    self._move_to_done(file_path)
+                    self._record_processed_file(
+                        file_path, "skipped", "Transcript already exists", processing_id
+                    )
+                    return
+
+                # Perform transcription
+                self.transcriber.transcribe_and_save(file_path, output_path)
+
+                # Move original file to done directory
                 self._move_to_done(file_path)
-                self._record_processed_file(
-                    file_path, "skipped", "Transcript already exists", processing_id
-                )
-                return
-
-            # Perform transcription
-            self.transcriber.transcribe_and_save(file_path, output_path)
 
-            # Move original file to done directory
-            self._move_to_done(file_path)
+                # Record successful processing
+                self._record_processed_file(file_path, "success", None, processing_id)
 
-            # Record successful processing
-            self._record_processed_file(file_path, "success", None, processing_id)
+                logger.info(f"[{processing_id}] Successfully processed")
 
-            logger.info(f"[{processing_id}] Successfully processed: {file_path.name}")
-
-        except Exception as e:
-            logger.error(f"[{processing_id}] Failed to process {file_path}: {e}")
-            self._record_processed_file(file_path, "error", str(e), processing_id)
+            except Exception as e:
+                logger.error(f"[{processing_id}] Failed to process: {e}")
+                self._record_processed_file(file_path, "error", str(e), processing_id)
+            finally:
+                # Always clean up processing state
+                with self._processing_lock:
+                    self._currently_processing.pop(file_key, None)
         finally:
-            # Always clean up processing state
-            with self._processing_lock:
-                self._currently_processing.pop(file_key, None)
+            current_file.reset(token)
 
     def _wait_for_file_stability(self, file_path: Path, max_wait: int = 30) -> None:
         """
@@ -436,7 +579,7 @@ class FolderMonitor:
             "errors": errors,
             "skipped": skipped,
             "success_rate": successful / total_files if total_files > 0 else 0,
-            "is_monitoring": self.observer.is_alive() if self.observer else False,
+            "is_monitoring": (self._observer.is_alive() if self._observer else False),
         }
 
     def get_recent_files(self, hours: int = 24) -> List[ProcessedFile]:
@@ -3,7 +3,7 @@
 import logging
 import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional
 
 import assemblyai as aai  # type: ignore
 from assemblyai import TranscriptError, TranscriptionConfig, SpeechModel
@@ -21,7 +21,10 @@ class AudioTranscriber:
     """Handles audio transcription using AssemblyAI API."""
 
     # Supported audio file extensions
-    SUPPORTED_EXTENSIONS = {".mp3", ".wav", ".m4a", ".flac", ".aac", ".ogg", ".webm"}
+    SUPPORTED_EXTENSIONS = frozenset(
+        {".mp3", ".wav", ".m4a", ".flac", ".aac", ".ogg", ".webm"}
+    )
+    _SUPPORTED_FORMATS_DISPLAY = ", ".join(sorted(SUPPORTED_EXTENSIONS))
 
     def __init__(
         self,
@@ -29,6 +32,8 @@ class AudioTranscriber:
         speech_model: str = "best",
         max_retries: int = 3,
         retry_delay: int = 60,
+        *,
+        transcriber_factory: Optional[Callable[..., Any]] = None,
     ) -> None:
         """
         Initialize the AudioTranscriber.
@@ -38,6 +43,8 @@ class AudioTranscriber:
             speech_model: Speech model to use ('best' or 'nano')
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            transcriber_factory: Builds the client from a TranscriptionConfig;
+                defaults to aai.Transcriber
         """
         if not api_key or api_key == "your_api_key_here":
             raise TranscriberError("Valid AssemblyAI API key is required")
@@ -52,7 +59,8 @@ class AudioTranscriber:
             raise TranscriberError(f"Unsupported speech model: {speech_model}")
 
         self.config = TranscriptionConfig(speech_model=model_map[speech_model])
-        self.transcriber = aai.Transcriber(config=self.config)
+        factory = transcriber_factory or aai.Transcriber
+        self.transcriber = factory(config=self.config)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
@@ -89,7 +97,7 @@ class AudioTranscriber:
         if not self.is_supported_file(file_path):
             raise TranscriberError(
                 f"Unsupported file format: {file_path.suffix}. "
-                f"Supported formats: {', '.join(sorted(self.SUPPORTED_EXTENSIONS))}"
+                f"Supported formats: {self._SUPPORTED_FORMATS_DISPLAY}"
             )
 
         logger.info(f"Starting transcription of: {file_path}")
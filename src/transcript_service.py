@@ -5,7 +5,7 @@ import signal
 import sys
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Protocol
 
 import click
 
@@ -22,16 +22,26 @@ from .monitor import FolderMonitor
 logger = logging.getLogger(__name__)
 
 
+class Clock(Protocol):
+    """Time source used by the service loop (the time module satisfies it)."""
+
+    def time(self) -> float: ...
+
+    def sleep(self, seconds: float) -> None: ...
+
+
 class TranscriptService:
     """Main service class for the Auto-Transcript-Agent."""
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, clock: Clock = time):
         """
         Initialize the transcript service.
 
         Args:
             config_path: Optional path to configuration file
+            clock: Time source for the main loop and statistics timing
         """
+        self._clock = clock
         self.config: Config
         self.transcriber: Optional[AudioTranscriber] = None
         self.monitor: Optional[FolderMonitor] = None
@@ -105,11 +115,13 @@ class TranscriptService:
             if self.monitor:
                 self.monitor.stop()
 
-            self.running = False
             logger.info("Auto-Transcript-Agent service stopped")
 
         except Exception as e:
             logger.error(f"Error during service shutdown: {e}")
+        finally:
+            # A failed shutdown still leaves the service stopped
+            self.running = False
 
     def run(self) -> None:
         """Run the service until interrupted."""
@@ -123,14 +135,15 @@ class TranscriptService:
             # Main service loop
             while self.running:
                 try:
-                    time.sleep(1)
+                    self._clock.sleep(1)
 
                     # Periodically log statistics
                     if hasattr(self, "_last_stats_time"):
-                        if time.time() - self._last_stats_time > 3600:  # Every hour
+                        now = self._clock.time()
+                        if now - self._last_stats_time > 3600:  # Every hour
                             self._log_statistics()
                     else:
-                        self._last_stats_time = time.time()
+                        self._last_stats_time = self._clock.time()
 
                 except KeyboardInterrupt:
                     logger.info("Received keyboard interrupt")
@@ -157,7 +170,7 @@ class TranscriptService:
         if self.monitor:
             stats = self.monitor.get_statistics()
             logger.info(f"Service statistics: {stats}")
-            self._last_stats_time = time.time()
+            self._last_stats_time = self._clock.time()
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -166,14 +179,15 @@ class TranscriptService:
         Returns:
             Dictionary with service status information
         """
+        statistics = self.monitor.get_statistics() if self.monitor else None
+
         status: Dict[str, Any] = {
             "running": self.running,
             "config_loaded": self.config is not None,
             "transcriber_initialized": self.transcriber is not None,
+            # Taken from the statistics so an unstarted monitor's observer isn't built
             "monitor_active": (
-                self.monitor is not None and self.monitor.observer.is_alive()
-                if self.monitor
-                else False
+                statistics["is_monitoring"] if statistics is not None else False
             ),
         }
 
@@ -185,7 +199,7 @@ class TranscriptService:
             }
 
         if self.monitor:
-            status["statistics"] = self.monitor.get_statistics()
+            status["statistics"] = statistics
             status["recent_files"] = [
                 {
                     "path": str(f.path),
@@ -0,0 +1,176 @@
+"""Shared pytest fixtures for Auto-Transcript-Agent tests."""
+
+import click
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
+
+from watchdog.observers import Observer
+
+from src.monitor import FolderMonitor
+from src.transcriber import AudioTranscriber
+from src.transcript_service import TranscriptService, cli
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--max-test-duration",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Fail tests whose call phase takes longer than SECONDS.",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Turn passing-but-slow tests into failures under --max-test-duration."""
+    outcome = yield
+    report = outcome.get_result()
+    limit = item.config.getoption("max_test_duration")
+    if limit and report.when == "call" and report.passed and report.duration > limit:
+        report.outcome = "failed"
+        report.longrepr = (
+            f"{item.nodeid} took {report.duration:.3f}s (limit {limit:.3f}s)"
+        )
+
+
+def _dummy_observer():
+    """Create an idle stand-in for the watchdog Observer."""
+    observer = Mock(spec=Observer)
+    observer.is_alive.return_value = False
+    return observer
+
+
+@pytest.fixture(autouse=True, scope="session")
+def dummy_observer():
+    """Keep FolderMonitor from registering real file system watches in tests."""
+    with patch("src.monitor.Observer", side_effect=_dummy_observer) as factory:
+        yield factory
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _warm_cli():
+    """Render the CLI help once so Click builds its command tree up front."""
+    cli.get_help(click.Context(cli))
+
+
+@pytest.fixture
+def real_observer(monkeypatch):
+    """Opt back in to the real watchdog Observer for integration tests."""
+    monkeypatch.setattr("src.monitor.Observer", Observer)
+    return Observer
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Session-wide directory for input files that tests only read."""
+    return tmp_path_factory.mktemp("xcript")
+
+
+@pytest.fixture(scope="session")
+def default_transcriber():
+    """Shared transcriber with default settings for tests that don't mutate it."""
+    return AudioTranscriber(api_key="valid_key")
+
+
+@pytest.fixture
+def fresh_transcriber():
+    """Per-test transcriber for tests that swap out its client or methods."""
+    return AudioTranscriber(api_key="valid_key")
+
+
+class StubTranscriber:
+    """Lightweight stand-in for AudioTranscriber in monitor tests.
+
+    Avoids the class introspection Mock(spec=AudioTranscriber) performs on every
+    construction while keeping Mock methods for call assertions.
+    """
+
+    def __init__(self):
+        self.is_supported_file = Mock(return_value=True)
+        self.transcribe_and_save = Mock(
+            return_value={
+                "status": "success",
+                "input_file": "test.mp3",
+                "output_file": "test.txt",
+                "transcript_length": 100,
+                "duration_seconds": 5.0,
+                "error": None,
+            }
+        )
+
+
+@pytest.fixture
+def mock_transcriber():
+    """Create a stub transcriber for monitor tests."""
+    return StubTranscriber()
+
+
+@pytest.fixture
+def monitor_root(tmp_path):
+    """Directory holding the monitor's input/output/done folders.
+
+    Override with a pyfakefs-backed path to keep a test class off the disk.
+    """
+    return tmp_path
+
+
+@pytest.fixture
+def make_monitor(monitor_root, mock_transcriber):
+    """Factory building a FolderMonitor rooted in monitor_root."""
+
+    def _make(input_dir=None):
+        return FolderMonitor(
+            input_dir=input_dir if input_dir is not None else monitor_root / "input",
+            output_dir=monitor_root / "output",
+            done_dir=monitor_root / "done",
+            transcriber=mock_transcriber,
+        )
+
+    return _make
+
+
+@pytest.fixture
+def service_env(request, mocker):
+    """Patch TranscriptService's collaborators and return the mock handles.
+
+    The loaded config is a plain SimpleNamespace data stub; parametrize
+    indirectly with a dict to override its attributes.
+
+    The collaborators are deliberately bare MagicMocks (no autospec): most
+    tests only set return values, and autospec would inspect every signature
+    on each patch. Tests that need signature or attribute checking opt in
+    locally with spec_set=, as test_transcript_service.py does.
+    """
+    config = SimpleNamespace(
+        assemblyai_api_key="test_api_key",
+        speech_model="best",
+        input_dir=Path("/test/input"),
+        output_dir=Path("/test/output"),
+        done_dir=Path("/test/done"),
+        poll_interval=5,
+        max_retries=3,
+        retry_delay=60,
+    )
+    vars(config).update(getattr(request, "param", {}))
+
+    mocks = mocker.patch.multiple(
+        "src.transcript_service",
+        load_config=DEFAULT,
+        setup_logging=DEFAULT,
+        validate_directories=DEFAULT,
+        AudioTranscriber=DEFAULT,
+        FolderMonitor=DEFAULT,
+    )
+    mocks["load_config"].return_value = config
+    return SimpleNamespace(**mocks)
+
+
+@pytest.fixture
+def service(service_env):
+    """TranscriptService built against the patched service_env."""
+    service = TranscriptService()
+    yield service
+    service.running = False
@@ -296,9 +296,11 @@ class TestSecurityFocused:
             setup_logging(config)
 
         # Check that API key is not in logs
-        log_text = caplog.text
-        assert "secret_api_key_12345" not in log_text
-        assert "***REDACTED***" in log_text or "secret_api_key" not in log_text
+        messages = [r.getMessage() for r in caplog.records]
+        assert not any("secret_api_key_12345" in m for m in messages)
+        assert any("***REDACTED***" in m for m in messages) or not any(
+            "secret_api_key" in m for m in messages
+        )
 
     def test_config_to_dict_redacts_api_key(self, tmp_path):
         """Test that config.to_dict() properly redacts the API key."""
@@ -1,12 +1,10 @@
 """Tests for the folder monitoring system."""
 
 import time
-import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 from src.monitor import FolderMonitor, ProcessedFile
-from src.transcriber import AudioTranscriber
 
 
 class TestProcessedFile:
@@ -30,21 +28,6 @@ class TestProcessedFile:
 class TestFolderMonitor:
     """Test the FolderMonitor class."""
 
-    @pytest.fixture
-    def mock_transcriber(self):
-        """Create a mock transcriber for testing."""
-        mock = Mock(spec=AudioTranscriber)
-        mock.is_supported_file.return_value = True
-        mock.transcribe_and_save.return_value = {
-            "status": "success",
-            "input_file": "test.mp3",
-            "output_file": "test.txt",
-            "transcript_length": 100,
-            "duration_seconds": 5.0,
-            "error": None,
-        }
-        return mock
-
     def test_init(self, tmp_path, mock_transcriber):
         """Test FolderMonitor initialization."""
         input_dir = tmp_path / "input"
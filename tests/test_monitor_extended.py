@@ -1,13 +1,43 @@
 """Extended tests for monitor functionality to improve coverage."""
 
+import logging
+import logging.handlers
 import pytest
+from pathlib import Path
 from unittest.mock import Mock, patch
-from threading import Event
+from threading import Event, Thread
 
-from src.monitor import FolderMonitor, AudioFileHandler
+from src.config import CurrentFileFilter, current_file
+from src.monitor import DEFAULT_DEBOUNCE_DELAY, FolderMonitor, AudioFileHandler
 from src.transcriber import AudioTranscriber, TranscriberError
 
 
+@pytest.fixture(autouse=True)
+def fast_stability(request, monkeypatch):
+    """Skip FolderMonitor's file stability wait unless marked no_fast_stability."""
+    if request.node.get_closest_marker("no_fast_stability"):
+        return None
+    wait = Mock()
+    monkeypatch.setattr(
+        FolderMonitor, "_wait_for_file_stability", lambda self, path: wait(path)
+    )
+    return wait
+
+
+@pytest.fixture
+def monitor_logs():
+    """Capture src.monitor records tagged the way setup_logging's handlers are."""
+    logger = logging.getLogger("src.monitor")
+    previous_level = logger.level
+    handler = logging.handlers.MemoryHandler(capacity=1024)
+    handler.addFilter(CurrentFileFilter())
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    yield handler
+    logger.removeHandler(handler)
+    logger.setLevel(previous_level)
+
+
 class TestAudioFileHandler:
     """Test the AudioFileHandler class."""
 
@@ -122,36 +152,158 @@ class TestAudioFileHandler:
         # Callback should be called for modifications too
         callback_mock.assert_called_once()
 
+    @pytest.fixture
+    def timers(self):
+        """Debounce timers created by debounced_handler, in creation order."""
+        return []
+
+    @pytest.fixture
+    def debounced_handler(self, mock_transcriber, callback_mock, timers):
+        """Handler with a 0.5s debounce whose timers only run when told to."""
+
+        class FakeTimer:
+            def __init__(self, interval, function, args=()):
+                self.function = function
+                self.args = args
+                self.cancelled = False
+                timers.append(self)
+
+            def start(self):
+                pass
+
+            def cancel(self):
+                self.cancelled = True
+
+            def expire(self):
+                if not self.cancelled:
+                    self.function(*self.args)
+
+        handler = AudioFileHandler(
+            mock_transcriber,
+            callback_mock,
+            debounce_delay=0.5,
+            timer_factory=FakeTimer,
+        )
+        yield handler
+        handler.stop()
+
+    @staticmethod
+    def _modified(path):
+        event = Mock()
+        event.is_directory = False
+        event.src_path = path
+        return event
+
+    def test_debounce_coalesces_bursts(self, debounced_handler, callback_mock, timers):
+        """Test that a burst of events yields one callback per quiet period."""
+        event = self._modified("/test/file.mp3")
+
+        for _ in range(50):
+            debounced_handler.on_modified(event)
+
+        # Nothing fires until the quiet period elapses
+        callback_mock.assert_not_called()
+
+        # "Advance the clock": run every timer that wasn't superseded
+        for timer in timers:
+            timer.expire()
+        debounced_handler._queue.join()  # let the worker hand it over
+
+        assert callback_mock.call_count == 1
+        assert debounced_handler._pending == {}
+
+    def test_stop_cancels_pending_timers(
+        self, debounced_handler, callback_mock, timers
+    ):
+        """Test that stop() drops files still waiting out their debounce."""
+        debounced_handler.on_modified(self._modified("/test/file.mp3"))
+
+        debounced_handler.stop()
+
+        assert [timer.cancelled for timer in timers] == [True]
+        assert debounced_handler._pending == {}
+        timers[0].expire()
+        callback_mock.assert_not_called()
+
+    def test_timer_firing_after_stop_is_ignored(
+        self, debounced_handler, callback_mock, timers
+    ):
+        """Test that a timer that outlives stop() enqueues nothing."""
+        debounced_handler.on_modified(self._modified("/test/file.mp3"))
+        debounced_handler.stop()
+
+        # Timer.cancel() can't stop a callback that has already begun
+        timers[0].function(*timers[0].args)
+
+        assert debounced_handler._queue.empty()
+        debounced_handler.on_modified(self._modified("/test/other.mp3"))
+        assert len(timers) == 1
+        callback_mock.assert_not_called()
+
+    def test_stop_waits_for_in_flight_callback(
+        self, debounced_handler, callback_mock, timers
+    ):
+        """Test that stop() returns only after the running callback finishes."""
+        started, release = Event(), Event()
+        callback_mock.side_effect = lambda path: (started.set(), release.wait(5))
+
+        debounced_handler.on_modified(self._modified("/test/first.mp3"))
+        debounced_handler.on_modified(self._modified("/test/second.mp3"))
+        timers[0].expire()
+        assert started.wait(5)
+
+        # second.mp3 settles while first.mp3 is still being processed
+        timers[1].expire()
+        stopper = Thread(target=debounced_handler.stop)
+        stopper.start()
+        stopper.join(0.1)
+        assert stopper.is_alive()
+
+        release.set()
+        stopper.join(5)
+        assert not stopper.is_alive()
+
+        # Callbacks ran one at a time and the queued file was dropped
+        callback_mock.assert_called_once_with(Path("/test/first.mp3"))
+
+    def test_dispatch_skips_file_already_processing(
+        self, mock_transcriber, callback_mock
+    ):
+        """Test that a file can't be handed to the callback twice at once."""
+        handler = AudioFileHandler(mock_transcriber, callback_mock)
+        handler.processing_files.add("/test/file.mp3")
+
+        handler._dispatch(Path("/test/file.mp3"))
+
+        callback_mock.assert_not_called()
+
 
 class TestFolderMonitorExtended:
     """Extended tests for FolderMonitor class."""
 
     @pytest.fixture
-    def mock_transcriber(self):
-        """Create a mock transcriber."""
-        mock = Mock(spec=AudioTranscriber)
-        mock.is_supported_file.return_value = True
-        mock.transcribe_and_save.return_value = {
-            "status": "success",
-            "input_file": "test.mp3",
-            "output_file": "test.txt",
-            "transcript_length": 100,
-            "duration_seconds": 5.0,
-            "error": None,
-        }
-        return mock
+    def monitor_root(self, fs):
+        """Run these tests against the in-memory pyfakefs file system."""
+        return Path("/audio")
+
+    def test_default_debounce_delay(self, make_monitor):
+        """Test that the monitor debounces events by default."""
+        monitor = make_monitor()
 
-    def test_start_and_stop(self, tmp_path, mock_transcriber):
+        assert DEFAULT_DEBOUNCE_DELAY == 0.5
+        assert monitor.event_handler.debounce_delay == DEFAULT_DEBOUNCE_DELAY
+
+    def test_stub_transcriber_matches_api(self, mock_transcriber):
+        """Test that the stub transcriber only stands in for real methods."""
+        for name in vars(mock_transcriber):
+            assert callable(getattr(AudioTranscriber, name))
+
+    def test_start_and_stop(self, make_monitor):
         """Test starting and stopping the monitor."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
         # Mock observer to avoid actual file watching
-        with patch.object(monitor, "observer") as mock_observer:
+        with patch.object(monitor, "_observer") as mock_observer:
             monitor.start()
 
             mock_observer.schedule.assert_called_once()
@@ -162,16 +314,24 @@ class TestFolderMonitorExtended:
             mock_observer.stop.assert_called_once()
             mock_observer.join.assert_called_once()
 
-    def test_process_file_nonexistent(self, tmp_path, mock_transcriber):
+    def test_no_observer_created_without_start(self, make_monitor, dummy_observer):
+        """Test that the watchdog observer is only built when first needed."""
+        dummy_observer.reset_mock()
+        monitor = make_monitor()
+
+        assert monitor._observer is None
+        assert monitor.get_statistics()["is_monitoring"] is False
+        monitor.stop()
+        dummy_observer.assert_not_called()
+
+        assert monitor.observer is monitor.observer
+        dummy_observer.assert_called_once_with()
+
+    def test_process_file_nonexistent(self, make_monitor):
         """Test processing a file that doesn't exist."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
-        nonexistent_file = tmp_path / "input" / "nonexistent.mp3"
+        nonexistent_file = monitor.input_dir / "nonexistent.mp3"
 
         # Should handle gracefully
         monitor._process_file(nonexistent_file)
@@ -179,131 +339,90 @@ class TestFolderMonitorExtended:
         # No processing should have occurred
         assert len(monitor.processed_files) == 0
 
-    def test_process_file_transcript_exists(self, tmp_path, mock_transcriber):
+    def test_process_file_transcript_exists(self, make_monitor, mock_transcriber):
         """Test processing when transcript already exists."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
         # Create input file and existing transcript
-        input_file = tmp_path / "input" / "test.mp3"
+        input_file = monitor.input_dir / "test.mp3"
         input_file.write_text("fake audio")
 
-        output_file = tmp_path / "output" / "test.txt"
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file = monitor.output_dir / "test.txt"
         output_file.write_text("existing transcript")
 
-        with (
-            patch.object(monitor, "_wait_for_file_stability"),
-            patch.object(monitor, "_move_to_done") as mock_move,
-        ):
-
+        with patch.object(monitor, "_move_to_done") as mock_move:
             monitor._process_file(input_file)
 
             # Should skip transcription and move to done
             mock_transcriber.transcribe_and_save.assert_not_called()
             mock_move.assert_called_once_with(input_file)
 
-    def test_process_file_transcription_error(self, tmp_path, mock_transcriber):
+    def test_process_file_transcription_error(self, make_monitor, mock_transcriber):
         """Test processing with transcription error."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
         # Make transcriber raise error
         mock_transcriber.transcribe_and_save.side_effect = TranscriberError("API error")
 
-        input_file = tmp_path / "input" / "test.mp3"
+        input_file = monitor.input_dir / "test.mp3"
         input_file.write_text("fake audio")
 
-        with patch.object(monitor, "_wait_for_file_stability"):
-            monitor._process_file(input_file)
+        monitor._process_file(input_file)
 
         # Should record error
         assert len(monitor.processed_files) == 1
         assert monitor.processed_files[0].status == "error"
         assert "API error" in monitor.processed_files[0].error_message
 
-    def test_wait_for_file_stability_missing_file(self, tmp_path, mock_transcriber):
+    @pytest.mark.no_fast_stability
+    def test_wait_for_file_stability_missing_file(self, make_monitor):
         """Test file stability check when file disappears."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
-        nonexistent_file = tmp_path / "nonexistent.mp3"
+        nonexistent_file = monitor.input_dir / "nonexistent.mp3"
 
         # Should handle missing file gracefully
         monitor._wait_for_file_stability(nonexistent_file)
 
-    def test_process_file_race_condition_protection(self, tmp_path, mock_transcriber):
+    def test_process_file_race_condition_protection(self, make_monitor, fast_stability):
         """Test that race condition protection works."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
-        input_file = tmp_path / "input" / "test.mp3"
-        input_file.parent.mkdir(exist_ok=True)
+        input_file = monitor.input_dir / "test.mp3"
         input_file.write_text("fake audio")
 
         file_key = str(input_file)
         # Manually set file as being processed
         monitor._currently_processing[file_key] = "test-id-123"
 
-        with patch.object(monitor, "_wait_for_file_stability") as mock_wait:
-            monitor._process_file(input_file)
+        monitor._process_file(input_file)
 
-            # Should not have waited for file stability because file was already being processed
-            mock_wait.assert_not_called()
+        # Should not have waited for file stability because file was already being processed
+        fast_stability.assert_not_called()
 
         # File should still be marked as processing (because we set it manually)
         assert file_key in monitor._currently_processing
 
-    def test_move_to_done_error(self, tmp_path, mock_transcriber):
+    def test_move_to_done_error(self, make_monitor):
         """Test move to done with file system error."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
-        test_file = tmp_path / "input" / "test.mp3"
+        test_file = monitor.input_dir / "test.mp3"
         test_file.write_text("fake audio")
 
         # Test with non-existent file (simpler error case)
-        nonexistent_file = tmp_path / "input" / "nonexistent.mp3"
+        nonexistent_file = monitor.input_dir / "nonexistent.mp3"
         # Should handle error gracefully
         monitor._move_to_done(nonexistent_file)
 
-    def test_process_file_with_processing_id(self, tmp_path, mock_transcriber):
+    def test_process_file_with_processing_id(self, make_monitor):
         """Test processing file with unique processing ID tracking."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
-        input_file = tmp_path / "input" / "test.mp3"
-        input_file.parent.mkdir(exist_ok=True)
+        input_file = monitor.input_dir / "test.mp3"
         input_file.write_text("fake audio")
 
-        with (
-            patch.object(monitor, "_wait_for_file_stability"),
-            patch.object(monitor, "_move_to_done") as mock_move,
-        ):
+        with patch.object(monitor, "_move_to_done") as mock_move:
             monitor._process_file(input_file)
 
             # Should have moved file to done
@@ -315,46 +434,34 @@ class TestFolderMonitorExtended:
         assert processed.processing_id is not None
         assert len(processed.processing_id) == 8  # Short UUID format
 
-    def test_start_existing_files_error(self, tmp_path, mock_transcriber):
+    def test_start_existing_files_error(
+        self, monitor_root, make_monitor, mock_transcriber
+    ):
         """Test processing existing files with transcription error."""
         # Create existing file
-        input_dir = tmp_path / "input"
-        input_dir.mkdir()
+        input_dir = monitor_root / "input"
+        input_dir.mkdir(parents=True)
         test_file = input_dir / "test.mp3"
         test_file.write_text("fake audio")
 
         # Make transcriber raise error
         mock_transcriber.transcribe_and_save.side_effect = TranscriberError("API error")
 
-        monitor = FolderMonitor(
-            input_dir=input_dir,
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor(input_dir=input_dir)
 
-        with patch.object(monitor, "_wait_for_file_stability"):
-            monitor._process_existing_files()
+        monitor._process_existing_files()
 
         # Should record error for existing file
         assert len(monitor.processed_files) == 1
         assert monitor.processed_files[0].status == "error"
 
-    def test_already_has_transcript_exists(self, tmp_path, mock_transcriber):
+    def test_already_has_transcript_exists(self, make_monitor):
         """Test checking if transcript exists when it does."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
         # Create input file and transcript
-        input_file = tmp_path / "input" / "test.mp3"
-        transcript_file = tmp_path / "output" / "test.txt"
-
-        input_file.parent.mkdir(exist_ok=True)
-        transcript_file.parent.mkdir(exist_ok=True)
+        input_file = monitor.input_dir / "test.mp3"
+        transcript_file = monitor.output_dir / "test.txt"
 
         input_file.write_text("fake audio")
         transcript_file.write_text("existing transcript")
@@ -362,19 +469,75 @@ class TestFolderMonitorExtended:
         # Should detect existing transcript
         assert monitor._already_has_transcript(input_file) is True
 
-    def test_already_has_transcript_missing(self, tmp_path, mock_transcriber):
+    def test_already_has_transcript_missing(self, make_monitor):
         """Test checking if transcript exists when it doesn't."""
-        monitor = FolderMonitor(
-            input_dir=tmp_path / "input",
-            output_dir=tmp_path / "output",
-            done_dir=tmp_path / "done",
-            transcriber=mock_transcriber,
-        )
+        monitor = make_monitor()
 
         # Create input file but no transcript
-        input_file = tmp_path / "input" / "test.mp3"
-        input_file.parent.mkdir(exist_ok=True)
+        input_file = monitor.input_dir / "test.mp3"
         input_file.write_text("fake audio")
 
         # Should detect missing transcript
         assert monitor._already_has_transcript(input_file) is False
+
+        # A transcript written later is seen straight away
+        (monitor.output_dir / "test.txt").write_text("late transcript")
+        assert monitor._already_has_transcript(input_file) is True
+
+    def test_poll_skips_transcript_stat_for_new_files(self, make_monitor, mocker):
+        """Test that polling doesn't stat the output for files it will process."""
+        monitor = make_monitor()
+
+        input_file = monitor.input_dir / "test.mp3"
+        input_file.write_text("fake audio")
+        transcript = monitor.output_dir / "test.txt"
+
+        # Spy on the (pyfakefs) path class actually in use for this test
+        exists = mocker.spy(type(transcript), "exists")
+        process = mocker.patch.object(
+            monitor, "_process_file", side_effect=lambda path: monitor._stop_event.set()
+        )
+
+        monitor._poll_directory()
+
+        process.assert_called_once_with(input_file)
+        assert [c for c in exists.call_args_list if c.args[0] == transcript] == []
+
+    @pytest.mark.parametrize("fails", [False, True], ids=["success", "error"])
+    def test_process_file_tags_logs_with_current_file(
+        self, make_monitor, mock_transcriber, monitor_logs, fails
+    ):
+        """Test that _process_file's log records carry the file being processed."""
+        monitor = make_monitor()
+        input_file = monitor.input_dir / "test.mp3"
+        input_file.write_text("fake audio")
+        if fails:
+            mock_transcriber.transcribe_and_save.side_effect = TranscriberError("boom")
+
+        monitor_logs.buffer.clear()  # drop the constructor's untagged records
+        monitor._process_file(input_file)
+
+        assert monitor_logs.buffer
+        assert {r.current_file for r in monitor_logs.buffer} == {str(input_file)}
+        assert current_file.get() == "-"
+
+    def test_process_file_resets_current_file_on_escaping_error(self, make_monitor):
+        """Test that the current_file context is restored when processing raises."""
+        monitor = make_monitor()
+        input_file = monitor.input_dir / "test.mp3"
+        input_file.write_text("fake audio")
+
+        with (
+            patch.object(
+                monitor, "_move_to_done", side_effect=RuntimeError("move failed")
+            ),
+            patch.object(
+                monitor,
+                "_record_processed_file",
+                side_effect=RuntimeError("record failed"),
+            ),
+        ):
+            with pytest.raises(RuntimeError, match="record failed"):
+                monitor._process_file(input_file)
+
+        assert current_file.get() == "-"
@@ -1,157 +1,176 @@
 """Extended tests for transcriber functionality to improve coverage."""
 
+import logging
+import logging.handlers
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from src.transcriber import AudioTranscriber, TranscriberError
 
+SUPPORTED = frozenset({".mp3", ".wav", ".m4a", ".flac", ".aac", ".ogg", ".webm"})
 
-class TestAudioTranscriberExtended:
-    """Extended tests for AudioTranscriber class."""
 
-    def test_transcribe_file_empty_text(self, tmp_path):
-        """Test transcription returning empty text."""
-        test_file = tmp_path / "test.mp3"
-        test_file.write_text("fake audio")
+@pytest.fixture
+def fake_audio_path():
+    """Path stand-in for tests whose transcriber client is mocked out."""
+    path = MagicMock(spec=Path)
+    path.exists.return_value = True
+    path.name = "test.mp3"
+    path.suffix = ".mp3"
+    path.stat.return_value.st_size = 10
+    path.__str__.return_value = "/fake/test.mp3"
+    path.__fspath__.return_value = "/fake/test.mp3"
+    return path
+
+
+@pytest.fixture(autouse=True, scope="module")
+def patched_aai():
+    """Replace the AssemblyAI client class once for the whole module."""
+    with patch("src.transcriber.aai.Transcriber") as transcriber_class:
+        yield transcriber_class
 
-        with patch("src.transcriber.aai.Transcriber") as mock_transcriber_class:
-            mock_transcript = Mock()
-            mock_transcript.status = "completed"
-            mock_transcript.text = ""  # Empty text
 
-            mock_transcriber_instance = Mock()
-            mock_transcriber_instance.transcribe.return_value = mock_transcript
-            mock_transcriber_class.return_value = mock_transcriber_instance
+@pytest.fixture(autouse=True)
+def _reset_patched_aai(patched_aai):
+    """Give every test a clean client mock."""
+    patched_aai.reset_mock(return_value=True, side_effect=True)
 
-            transcriber = AudioTranscriber(api_key="valid_key")
-            transcriber.transcriber = mock_transcriber_instance
 
-            result = transcriber.transcribe_file(test_file)
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Make retry delays instant so a lost patch can't slow the suite."""
+    sleep = Mock()
+    monkeypatch.setattr("src.transcriber.time.sleep", sleep)
+    return sleep
 
-            assert result == ""
 
-    @patch("src.transcriber.time.sleep")
-    @patch("src.transcriber.aai.Transcriber")
+@pytest.fixture(scope="module")
+def transcriber_logs():
+    """Capture src.transcriber log records once for the whole module."""
+    logger = logging.getLogger("src.transcriber")
+    previous_level = logger.level
+    handler = logging.handlers.MemoryHandler(capacity=1024)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    yield handler
+    logger.removeHandler(handler)
+    logger.setLevel(previous_level)
+
+
+class TestAudioTranscriberExtended:
+    """Extended tests for AudioTranscriber class."""
+
+    def test_transcribe_file_empty_text(
+        self, patched_aai, fake_audio_path, fresh_transcriber
+    ):
+        """Test transcription returning empty text."""
+        patched_aai.return_value.transcribe.return_value = Mock(
+            status="completed", text=""  # Empty text
+        )
+
+        result = fresh_transcriber.transcribe_file(fake_audio_path)
+
+        assert result == ""
+
     def test_transcribe_file_retry_success(
-        self, mock_transcriber_class, mock_sleep, tmp_path
+        self, _no_sleep, patched_aai, fake_audio_path
     ):
         """Test transcription succeeding after retries."""
-        test_file = tmp_path / "test.mp3"
-        test_file.write_text("fake audio")
-
         # First call fails, second succeeds
-        mock_transcript_error = Mock()
-        mock_transcript_error.status = "error"
-        mock_transcript_error.error = "Temporary error"
+        mock_transcript_error = Mock(status="error", error="Temporary error")
 
-        mock_transcript_success = Mock()
-        mock_transcript_success.status = "completed"
-        mock_transcript_success.text = "Success!"
+        mock_transcript_success = Mock(status="completed", text="Success!")
 
-        mock_transcriber_instance = Mock()
-        mock_transcriber_instance.transcribe.side_effect = [
+        patched_aai.return_value.transcribe.side_effect = (
             mock_transcript_error,
             mock_transcript_success,
-        ]
-        mock_transcriber_class.return_value = mock_transcriber_instance
+        )
 
         transcriber = AudioTranscriber(
             api_key="valid_key", max_retries=2, retry_delay=1
         )
-        transcriber.transcriber = mock_transcriber_instance
 
-        result = transcriber.transcribe_file(test_file)
+        result = transcriber.transcribe_file(fake_audio_path)
 
         assert result == "Success!"
-        assert mock_sleep.call_count == 1  # Should have slept between retries
+        assert _no_sleep.call_count == 1  # Should have slept between retries
 
-    @patch("src.transcriber.time.sleep")
-    @patch("src.transcriber.aai.Transcriber")
     def test_transcribe_file_generic_exception_retry(
-        self, mock_transcriber_class, mock_sleep, tmp_path
+        self, _no_sleep, patched_aai, fake_audio_path
     ):
         """Test transcription with generic exception and retry."""
-        test_file = tmp_path / "test.mp3"
-        test_file.write_text("fake audio")
-
-        mock_transcriber_instance = Mock()
-        mock_transcriber_instance.transcribe.side_effect = [
+        patched_aai.return_value.transcribe.side_effect = (
             Exception("Network error"),
             Exception("Another error"),
-        ]
-        mock_transcriber_class.return_value = mock_transcriber_instance
+        )
 
         transcriber = AudioTranscriber(
             api_key="valid_key", max_retries=2, retry_delay=1
         )
-        transcriber.transcriber = mock_transcriber_instance
 
-        with pytest.raises(
-            TranscriberError, match="Transcription failed after 2 attempts"
-        ):
-            transcriber.transcribe_file(test_file)
+        with pytest.raises(TranscriberError) as ei:
+            transcriber.transcribe_file(fake_audio_path)
+        assert str(ei.value).startswith("Transcription failed after 2 attempts")
 
-        assert mock_sleep.call_count == 1  # Should have slept between retries
+        assert _no_sleep.call_count == 1  # Should have slept between retries
 
-    def test_save_transcript_directory_creation_error(self, tmp_path):
+    def test_save_transcript_directory_creation_error(self, default_transcriber):
         """Test save transcript with directory creation error."""
-        transcriber = AudioTranscriber(api_key="valid_key")
-
-        # Try to save to a path that can't be created
-        output_path = Path("/root/restricted/transcript.txt")
+        output_path = Path("/fake/restricted/transcript.txt")
 
-        with pytest.raises(TranscriberError, match="Failed to save transcript"):
-            transcriber.save_transcript("test transcript", output_path)
+        # Make the output directory impossible to create
+        with patch.object(Path, "mkdir", side_effect=PermissionError("denied")):
+            with pytest.raises(TranscriberError) as ei:
+                default_transcriber.save_transcript("test transcript", output_path)
+        assert str(ei.value).startswith("Failed to save transcript")
 
-    def test_save_transcript_write_error(self, tmp_path):
+    def test_save_transcript_write_error(self, default_transcriber):
         """Test save transcript with file write error."""
-        transcriber = AudioTranscriber(api_key="valid_key")
-
-        output_path = tmp_path / "transcript.txt"
+        output_path = Path("/fake/transcript.txt")
 
-        # Mock open to raise exception
-        with patch("builtins.open", side_effect=OSError("Permission denied")):
-            with pytest.raises(TranscriberError, match="Failed to save transcript"):
-                transcriber.save_transcript("test transcript", output_path)
+        # Mock mkdir and open so nothing touches the disk
+        with (
+            patch.object(Path, "mkdir"),
+            patch("builtins.open", side_effect=OSError("Permission denied")),
+        ):
+            with pytest.raises(TranscriberError) as ei:
+                default_transcriber.save_transcript("test transcript", output_path)
+        assert str(ei.value).startswith("Failed to save transcript")
+        assert str(ei.value).endswith("Permission denied")
 
-    def test_get_transcription_info_nonexistent_file(self):
+    def test_get_transcription_info_nonexistent_file(self, default_transcriber):
         """Test getting info for non-existent file."""
-        transcriber = AudioTranscriber(api_key="valid_key")
-
         nonexistent_file = Path("/tmp/nonexistent.mp3")
-        info = transcriber.get_transcription_info(nonexistent_file)
+        info = default_transcriber.get_transcription_info(nonexistent_file)
 
         assert info["file_path"] == str(nonexistent_file)
         assert info["file_size"] == 0
         assert info["supported"] is True  # Based on extension
         assert info["extension"] == ".mp3"
 
-    @patch("src.transcriber.aai.Transcriber")
-    def test_transcribe_and_save_save_error(self, mock_transcriber_class, tmp_path):
+    def test_transcribe_and_save_save_error(
+        self, patched_aai, tmp_path, fresh_transcriber
+    ):
         """Test transcribe_and_save with save error."""
         input_file = tmp_path / "input.mp3"
         input_file.write_text("fake audio")
 
-        mock_transcript = Mock()
-        mock_transcript.status = "completed"
-        mock_transcript.text = "Transcribed text"
-
-        mock_transcriber_instance = Mock()
-        mock_transcriber_instance.transcribe.return_value = mock_transcript
-        mock_transcriber_class.return_value = mock_transcriber_instance
-
-        transcriber = AudioTranscriber(api_key="valid_key")
-        transcriber.transcriber = mock_transcriber_instance
+        patched_aai.return_value.transcribe.return_value = Mock(
+            status="completed", text="Transcribed text"
+        )
 
         # Mock save_transcript to raise error
         with patch.object(
-            transcriber, "save_transcript", side_effect=TranscriberError("Save failed")
+            fresh_transcriber,
+            "save_transcript",
+            side_effect=TranscriberError("Save failed"),
         ):
             output_file = tmp_path / "output.txt"
 
-            with pytest.raises(TranscriberError, match="Save failed"):
-                transcriber.transcribe_and_save(input_file, output_file)
+            with pytest.raises(TranscriberError) as ei:
+                fresh_transcriber.transcribe_and_save(input_file, output_file)
+        assert str(ei.value) == "Save failed"
 
     def test_init_speech_model_configuration(self):
         """Test initialization with different speech models."""
@@ -163,55 +182,47 @@ class TestAudioTranscriberExtended:
         assert transcriber_best.max_retries == 3
         assert transcriber_nano.max_retries == 3
 
-    def test_supported_extensions_case_insensitive(self):
+    @pytest.mark.parametrize("name", ["test.MP3", "test.WaV", "test.M4A", "test.FLAC"])
+    def test_supported_extensions_case_insensitive(self, name, default_transcriber):
         """Test that file extension checking is case insensitive."""
-        transcriber = AudioTranscriber(api_key="valid_key")
+        assert default_transcriber.is_supported_file(Path(name))
 
-        # Test various cases
-        assert transcriber.is_supported_file(Path("test.MP3"))
-        assert transcriber.is_supported_file(Path("test.WaV"))
-        assert transcriber.is_supported_file(Path("test.M4A"))
-        assert transcriber.is_supported_file(Path("test.FLAC"))
-
-    @patch("src.transcriber.aai.Transcriber")
-    def test_transcribe_file_logging(self, mock_transcriber_class, tmp_path, caplog):
+    def test_transcribe_file_logging(
+        self, patched_aai, fake_audio_path, transcriber_logs, fresh_transcriber
+    ):
         """Test that transcription logs appropriately."""
-        test_file = tmp_path / "test.mp3"
-        test_file.write_text("fake audio")
-
-        mock_transcript = Mock()
-        mock_transcript.status = "completed"
-        mock_transcript.text = "Transcribed text with some length"
-
-        mock_transcriber_instance = Mock()
-        mock_transcriber_instance.transcribe.return_value = mock_transcript
-        mock_transcriber_class.return_value = mock_transcriber_instance
-
-        transcriber = AudioTranscriber(api_key="valid_key")
-        transcriber.transcriber = mock_transcriber_instance
+        patched_aai.return_value.transcribe.return_value = Mock(
+            status="completed", text="Transcribed text with some length"
+        )
 
-        with caplog.at_level("INFO"):
-            transcriber.transcribe_file(test_file)
+        transcriber_logs.buffer.clear()
+        fresh_transcriber.transcribe_file(fake_audio_path)
+        messages = [r.getMessage() for r in transcriber_logs.buffer]
 
         # Check that appropriate log messages were generated
-        assert "Starting transcription" in caplog.text
-        assert "Successfully transcribed" in caplog.text
-        assert "characters" in caplog.text
-
-    def test_transcribe_file_various_extensions(self, tmp_path):
-        """Test transcription with various supported file extensions."""
-        transcriber = AudioTranscriber(api_key="valid_key")
+        assert any(m.startswith("Starting transcription") for m in messages)
+        assert any(
+            m.startswith("Successfully transcribed") and "characters" in m
+            for m in messages
+        )
 
-        extensions = [".mp3", ".wav", ".m4a", ".flac", ".aac", ".ogg", ".webm"]
+    def test_supported_extensions_set(self):
+        """Test the supported extensions are exactly the expected frozenset."""
+        assert isinstance(AudioTranscriber.SUPPORTED_EXTENSIONS, frozenset)
+        assert AudioTranscriber.SUPPORTED_EXTENSIONS == SUPPORTED
 
-        for ext in extensions:
-            test_file = tmp_path / f"test{ext}"
-            test_file.write_text("fake audio")
+    @pytest.mark.parametrize("ext", sorted(SUPPORTED))
+    def test_transcribe_file_various_extensions(
+        self, ext, shared_tmp, default_transcriber
+    ):
+        """Test transcription with various supported file extensions."""
+        test_file = shared_tmp / f"various{ext}"
+        test_file.write_text("fake audio")
 
-            # Should recognize as supported
-            assert transcriber.is_supported_file(test_file)
+        # Should recognize as supported
+        assert default_transcriber.is_supported_file(test_file)
 
-            # Test getting info
-            info = transcriber.get_transcription_info(test_file)
-            assert info["supported"] is True
-            assert info["extension"] == ext
+        # Test getting info
+        info = default_transcriber.get_transcription_info(test_file)
+        assert info["supported"] is True
+        assert info["extension"] == ext
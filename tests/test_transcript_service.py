@@ -3,34 +3,55 @@
 import pytest
 from unittest.mock import Mock, patch
 
+from src.monitor import FolderMonitor
+from src.transcriber import AudioTranscriber
 from src.transcript_service import TranscriptService
 from src.config import ConfigError
 
 
+def make_monitor_mock(stats, recent, alive=True):
+    """Build a FolderMonitor mock reporting the given statistics and files."""
+    monitor = Mock(spec_set=FolderMonitor)
+    monitor.get_statistics.return_value = {**stats, "is_monitoring": alive}
+    monitor.get_recent_files.return_value = recent
+    return monitor
+
+
+@pytest.fixture(scope="class")
+def mock_config(tmp_path_factory):
+    """Create a mock configuration shared by the class (tests don't mutate it)."""
+    root = tmp_path_factory.mktemp("svc")
+    mock_config = Mock()
+    mock_config.assemblyai_api_key = "test_api_key"
+    mock_config.speech_model = "best"
+    mock_config.input_dir = root / "input"
+    mock_config.output_dir = root / "output"
+    mock_config.done_dir = root / "done"
+    mock_config.poll_interval = 5
+    mock_config.max_retries = 3
+    mock_config.retry_delay = 60
+    mock_config.log_level = "INFO"
+    mock_config.log_file = None
+    return mock_config
+
+
 class TestTranscriptService:
     """Test the TranscriptService class."""
 
-    @pytest.fixture
-    def mock_config(self, tmp_path):
-        """Create a mock configuration for testing."""
-        mock_config = Mock()
-        mock_config.assemblyai_api_key = "test_api_key"
-        mock_config.speech_model = "best"
-        mock_config.input_dir = tmp_path / "input"
-        mock_config.output_dir = tmp_path / "output"
-        mock_config.done_dir = tmp_path / "done"
-        mock_config.poll_interval = 5
-        mock_config.max_retries = 3
-        mock_config.retry_delay = 60
-        mock_config.log_level = "INFO"
-        mock_config.log_file = None
-        return mock_config
-
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_init_success(self, mock_setup_logging, mock_load_config, mock_config):
+    @pytest.fixture(autouse=True)
+    def _svc_patches(self, mock_config):
+        """Patch config loading and logging setup for every test."""
+        with (
+            patch(
+                "src.transcript_service.load_config", return_value=mock_config
+            ) as mock_load_config,
+            patch("src.transcript_service.setup_logging") as mock_setup_logging,
+        ):
+            yield mock_load_config, mock_setup_logging
+
+    def test_init_success(self, _svc_patches, mock_config):
         """Test successful service initialization."""
-        mock_load_config.return_value = mock_config
+        mock_load_config, mock_setup_logging = _svc_patches
 
         service = TranscriptService()
 
@@ -42,16 +63,14 @@ class TestTranscriptService:
         mock_load_config.assert_called_once_with(None)
         mock_setup_logging.assert_called_once_with(mock_config)
 
-    @patch("src.transcript_service.load_config")
-    def test_init_config_error(self, mock_load_config):
+    def test_init_config_error(self, _svc_patches):
         """Test initialization with configuration error."""
+        mock_load_config, _ = _svc_patches
         mock_load_config.side_effect = ConfigError("Invalid config")
 
         with pytest.raises(SystemExit):
             TranscriptService()
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
     @patch("src.transcript_service.validate_directories")
     @patch("src.transcript_service.AudioTranscriber")
     @patch("src.transcript_service.FolderMonitor")
@@ -60,14 +79,11 @@ class TestTranscriptService:
         mock_monitor_class,
         mock_transcriber_class,
         mock_validate_dirs,
-        mock_setup_logging,
-        mock_load_config,
         mock_config,
     ):
         """Test successful service startup."""
-        mock_load_config.return_value = mock_config
-        mock_transcriber = Mock()
-        mock_monitor = Mock()
+        mock_transcriber = Mock(spec_set=AudioTranscriber)
+        mock_monitor = Mock(spec_set=FolderMonitor)
         mock_transcriber_class.return_value = mock_transcriber
         mock_monitor_class.return_value = mock_monitor
 
@@ -84,14 +100,8 @@ class TestTranscriptService:
         )
         mock_monitor.start.assert_called_once()
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_start_already_running(
-        self, mock_setup_logging, mock_load_config, mock_config
-    ):
+    def test_start_already_running(self):
         """Test starting service when already running."""
-        mock_load_config.return_value = mock_config
-
         service = TranscriptService()
         service.running = True
 
@@ -101,52 +111,35 @@ class TestTranscriptService:
         assert service.transcriber is None
         assert service.monitor is None
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_stop(self, mock_setup_logging, mock_load_config, mock_config):
+    def test_stop(self):
         """Test stopping the service."""
-        mock_load_config.return_value = mock_config
-
         service = TranscriptService()
         service.running = True
-        service.monitor = Mock()
+        service.monitor = Mock(spec_set=FolderMonitor)
 
         service.stop()
 
         assert service.running is False
         service.monitor.stop.assert_called_once()
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_stop_not_running(self, mock_setup_logging, mock_load_config, mock_config):
+    def test_stop_not_running(self):
         """Test stopping service when not running."""
-        mock_load_config.return_value = mock_config
-
         service = TranscriptService()
-        service.monitor = Mock()
+        service.monitor = Mock(spec_set=FolderMonitor)
 
         # Should return early
         service.stop()
 
         service.monitor.stop.assert_not_called()
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_get_status(self, mock_setup_logging, mock_load_config, mock_config):
+    def test_get_status(self):
         """Test getting service status."""
-        mock_load_config.return_value = mock_config
-
         service = TranscriptService()
         service.running = True
-        service.transcriber = Mock()
-        service.monitor = Mock()
-        service.monitor.observer.is_alive.return_value = True
-        service.monitor.get_statistics.return_value = {
-            "total_processed": 10,
-            "successful": 8,
-            "errors": 2,
-        }
-        service.monitor.get_recent_files.return_value = []
+        service.transcriber = Mock(spec_set=AudioTranscriber)
+        service.monitor = make_monitor_mock(
+            {"total_processed": 10, "successful": 8, "errors": 2}, []
+        )
 
         status = service.get_status()
 
@@ -158,34 +151,27 @@ class TestTranscriptService:
         assert "statistics" in status
         assert "recent_files" in status
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    @patch("src.transcript_service.signal.signal")
-    @patch("src.transcript_service.time.sleep")
-    def test_run_keyboard_interrupt(
-        self, mock_sleep, mock_signal, mock_setup_logging, mock_load_config, mock_config
-    ):
+    def test_run_keyboard_interrupt(self, monkeypatch):
         """Test running service with keyboard interrupt."""
-        mock_load_config.return_value = mock_config
-        mock_sleep.side_effect = KeyboardInterrupt()
+        monkeypatch.setattr("src.transcript_service.signal.signal", Mock())
+        sleep = Mock(side_effect=KeyboardInterrupt)
+        monkeypatch.setattr("src.transcript_service.time.sleep", sleep)
 
         service = TranscriptService()
-        service.start = Mock()
+        # start() is what flips running on, so the main loop is entered
+        service.start = Mock(side_effect=lambda: setattr(service, "running", True))
         service.stop = Mock()
 
         service.run()
 
         service.start.assert_called_once()
+        sleep.assert_called_once_with(1)
         service.stop.assert_called_once()
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_signal_handler(self, mock_setup_logging, mock_load_config, mock_config):
+    def test_signal_handler(self):
         """Test signal handler for graceful shutdown."""
         import signal
 
-        mock_load_config.return_value = mock_config
-
         service = TranscriptService()
         service.running = True
 
@@ -194,19 +180,12 @@ class TestTranscriptService:
 
         assert service.running is False
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_log_statistics(self, mock_setup_logging, mock_load_config, mock_config):
+    def test_log_statistics(self):
         """Test logging service statistics."""
-        mock_load_config.return_value = mock_config
-
         service = TranscriptService()
-        service.monitor = Mock()
-        service.monitor.get_statistics.return_value = {
-            "total_processed": 5,
-            "successful": 4,
-            "errors": 1,
-        }
+        service.monitor = make_monitor_mock(
+            {"total_processed": 5, "successful": 4, "errors": 1}, []
+        )
 
         # Should not raise an exception
         service._log_statistics()
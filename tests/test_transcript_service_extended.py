@@ -1,375 +1,455 @@
 """Extended tests for transcript service to improve coverage."""
 
+import click
 import pytest
 import signal
-import time
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import MappingProxyType
+from unittest.mock import MagicMock, Mock
 from click.testing import CliRunner
 
 from src.transcript_service import TranscriptService, cli, main
 
+# Placeholder in parametrized CLI args for the fake_audio path
+AUDIO_ARG = object()
+
+# Canned service responses, read-only so tests can't leak changes to each other
+STATUS_FIXTURE = MappingProxyType(
+    {
+        "running": True,
+        "config_loaded": True,
+        "transcriber_initialized": True,
+        "monitor_active": True,
+        "directories": MappingProxyType(
+            {
+                "input": "/test/input",
+                "output": "/test/output",
+                "done": "/test/done",
+            }
+        ),
+        "statistics": MappingProxyType(
+            {
+                "total_processed": 10,
+                "successful": 8,
+                "errors": 2,
+                "skipped": 0,
+                "success_rate": 0.8,
+            }
+        ),
+    }
+)
+TRANSCRIBE_SUCCESS_RESULT = MappingProxyType(
+    {
+        "status": "success",
+        "duration_seconds": 5.2,
+        "transcript_length": 150,
+        "output_file": "/fake/test.txt",
+    }
+)
+TRANSCRIBE_ERROR_RESULT = MappingProxyType(
+    {"status": "error", "error": "API quota exceeded"}
+)
+
+
+# Setups for test_cli_error_paths; each returns a callable that configures
+# the patched TranscriptService class and create_sample_config mocks
+
+
+def raise_from_run(error):
+    def setup(service_class, create_config):
+        service_class.return_value.run.side_effect = error
+
+    return setup
+
+
+def raise_from_service_init(error):
+    def setup(service_class, create_config):
+        service_class.side_effect = error
+
+    return setup
+
+
+def return_from_transcribe(result):
+    def setup(service_class, create_config):
+        transcribe = service_class.return_value.transcriber.transcribe_and_save
+        transcribe.return_value = result
+
+    return setup
+
+
+def raise_from_create_config(error):
+    def setup(service_class, create_config):
+        create_config.side_effect = error
+
+    return setup
+
+
+@pytest.fixture(scope="module")
+def invoke_cli():
+    """Run a CLI command in-process, without CliRunner's stdio redirection.
+
+    Returns the exit code; pair with capsys to check what was echoed. Use
+    CliRunner where exit-on-error behavior or argument parsing is under test.
+    """
+
+    def _invoke(args):
+        try:
+            ctx = cli.make_context("cli", list(args))
+            with ctx:
+                cli.invoke(ctx)
+        except click.exceptions.Exit as exc:
+            return exc.exit_code
+        return 0
+
+    return _invoke
+
+
+@pytest.fixture(scope="class")
+def runner():
+    """Share one CliRunner across a test class."""
+    return CliRunner()
+
 
+class MonitorStub:
+    """Minimal FolderMonitor stand-in for tests that only stop or poll stats."""
+
+    def __init__(self, stats=None, stop_error=None):
+        self.stats = stats or {}
+        self.stop_error = stop_error
+        self.statistics_calls = 0
+
+    def get_statistics(self):
+        self.statistics_calls += 1
+        return self.stats
+
+    def stop(self):
+        if self.stop_error is not None:
+            raise self.stop_error
+
+
+class FakeClock:
+    """Deterministic stand-in for the time module used by TranscriptService.
+
+    sleep() raises the next entry of ``raise_on_sleep``, if any, without
+    advancing ``now`` (an interrupted sleep doesn't elapse); None or an
+    exhausted sequence means the sleep completes and ``now`` moves forward.
+    """
+
+    def __init__(self, now=10_000.0, raise_on_sleep=()):
+        self.now = now
+        self._raise_on_sleep = list(raise_on_sleep)
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        if self._raise_on_sleep:
+            error = self._raise_on_sleep.pop(0)
+            if error is not None:
+                raise error
+        self.now += seconds
+
+
+@pytest.mark.usefixtures("service_env")
 class TestTranscriptServiceExtended:
     """Extended tests for TranscriptService class."""
 
-    def test_init_general_exception(self):
+    def test_init_general_exception(self, service_env):
         """Test initialization with general exception."""
-        with patch(
-            "src.transcript_service.load_config",
-            side_effect=RuntimeError("Unexpected error"),
-        ):
-            with pytest.raises(SystemExit):
-                TranscriptService()
-
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    @patch("src.transcript_service.validate_directories")
-    @patch("src.transcript_service.AudioTranscriber")
-    @patch("src.transcript_service.FolderMonitor")
-    def test_start_validation_error(
-        self,
-        mock_monitor_class,
-        mock_transcriber_class,
-        mock_validate_dirs,
-        mock_setup_logging,
-        mock_load_config,
-    ):
-        """Test start with directory validation error."""
-        mock_config = Mock()
-        mock_load_config.return_value = mock_config
-        mock_validate_dirs.side_effect = Exception("Validation failed")
+        service_env.load_config.side_effect = RuntimeError("Unexpected error")
 
-        service = TranscriptService()
+        with pytest.raises(SystemExit):
+            TranscriptService()
+
+    def test_start_validation_error(self, service_env, service):
+        """Test start with directory validation error."""
+        service_env.validate_directories.side_effect = Exception("Validation failed")
 
         with pytest.raises(Exception, match="Validation failed"):
             service.start()
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_stop_with_monitor_error(self, mock_setup_logging, mock_load_config):
+    def test_stop_with_monitor_error(self, service):
         """Test stopping service with monitor error."""
-        mock_config = Mock()
-        mock_load_config.return_value = mock_config
-
-        service = TranscriptService()
         service.running = True
-        service.monitor = Mock()
-        service.monitor.stop.side_effect = Exception("Stop failed")
+        service.monitor = MonitorStub(stop_error=Exception("Stop failed"))
 
         # Should handle error gracefully
         service.stop()
         assert service.running is False
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    @patch("src.transcript_service.time.sleep")
-    def test_run_with_exception(self, mock_sleep, mock_setup_logging, mock_load_config):
+    def test_run_with_exception(self):
         """Test run method with exception during operation."""
-        mock_config = Mock()
-        mock_load_config.return_value = mock_config
-
-        service = TranscriptService()
+        clock = FakeClock(raise_on_sleep=(Exception("Unexpected error"),))
+        service = TranscriptService(clock=clock)
         service.start = Mock()
         service.stop = Mock()
-
-        # Make sleep raise exception
-        mock_sleep.side_effect = Exception("Unexpected error")
+        service.running = True
 
         service.run()
 
         service.start.assert_called_once()
         service.stop.assert_called_once()
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    @patch("src.transcript_service.time.sleep")
-    def test_run_statistics_logging(
-        self, mock_sleep, mock_setup_logging, mock_load_config
-    ):
+    def test_run_statistics_logging(self):
         """Test statistics logging during run."""
-        mock_config = Mock()
-        mock_load_config.return_value = mock_config
-
-        service = TranscriptService()
+        clock = FakeClock(raise_on_sleep=(None, KeyboardInterrupt()))
+        service = TranscriptService(clock=clock)
         service.start = Mock()
         service.stop = Mock()
-        service.monitor = Mock()
-        service.monitor.get_statistics.return_value = {"test": "stats"}
+        service.running = True
+        service.monitor = MonitorStub(stats={"test": "stats"})
 
         # Simulate time passing for statistics
-        service._last_stats_time = time.time() - 3700  # Over an hour ago
-
-        # Make sleep raise KeyboardInterrupt after one iteration
-        mock_sleep.side_effect = [None, KeyboardInterrupt()]
+        service._last_stats_time = clock.now - 3700  # Over an hour ago
 
         service.run()
 
         # Should have logged statistics
-        service.monitor.get_statistics.assert_called()
-
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_get_status_no_monitor(self, mock_setup_logging, mock_load_config):
+        assert service.monitor.statistics_calls >= 1
+        assert service._last_stats_time == clock.now
+
+    @pytest.mark.parametrize(
+        "service_env",
+        [
+            {
+                "input_dir": Path("/srv/audio/in"),
+                "output_dir": Path("/srv/audio/transcripts"),
+                "done_dir": Path("/srv/audio/done"),
+            }
+        ],
+        indirect=True,
+    )
+    def test_get_status_no_monitor(self, service):
         """Test get_status when monitor is None."""
-        mock_config = Mock()
-        mock_config.input_dir = Path("/test/input")
-        mock_config.output_dir = Path("/test/output")
-        mock_config.done_dir = Path("/test/done")
-        mock_load_config.return_value = mock_config
-
-        service = TranscriptService()
         status = service.get_status()
 
         assert status["running"] is False
         assert status["monitor_active"] is False
-        assert "directories" in status
+        assert status["directories"] == {
+            "input": "/srv/audio/in",
+            "output": "/srv/audio/transcripts",
+            "done": "/srv/audio/done",
+        }
+
+    def test_get_status_does_not_build_observer(
+        self, service, make_monitor, dummy_observer
+    ):
+        """Test that querying an unstarted monitor leaves its observer unbuilt."""
+        service.monitor = make_monitor()
+        dummy_observer.reset_mock()
+
+        status = service.get_status()
+
+        assert status["monitor_active"] is False
+        assert service.monitor._observer is None
+        dummy_observer.assert_not_called()
 
 
 class TestCLICommands:
     """Test CLI command functionality."""
 
-    def test_cli_help(self):
+    @pytest.fixture
+    def mock_service_class(self, mocker):
+        """Patch the TranscriptService class used by the CLI commands."""
+        return mocker.patch("src.transcript_service.TranscriptService")
+
+    @pytest.fixture
+    def mock_service(self, mock_service_class):
+        """The service instance the CLI commands will construct."""
+        return mock_service_class.return_value
+
+    @pytest.fixture
+    def mock_get_path(self, mocker):
+        """Patch the default config path lookup used by init-config."""
+        return mocker.patch("src.config.get_default_config_path")
+
+    @pytest.fixture
+    def mock_create_config(self, mocker):
+        """Patch sample config creation used by init-config."""
+        return mocker.patch("src.config.create_sample_config")
+
+    @pytest.fixture
+    def fake_audio(self, mocker):
+        """Audio path that passes Click's exists=True check without a real file."""
+        mocker.patch(
+            "click.Path.convert", side_effect=lambda value, *a, **k: Path(value)
+        )
+        return "/fake/test.mp3"
+
+    def test_cli_help(self, capsys):
         """Test CLI help command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
+        click.echo(cli.get_help(click.Context(cli)))
+        output = capsys.readouterr().out
 
-        assert result.exit_code == 0
-        assert "Auto-Transcript-Agent" in result.output
-        assert "run" in result.output
-        assert "status" in result.output
-        assert "transcribe" in result.output
+        assert "Auto-Transcript-Agent" in output
+        assert "run" in output
+        assert "status" in output
+        assert "transcribe" in output
 
-    @patch("src.transcript_service.TranscriptService")
-    def test_run_command(self, mock_service_class):
+    def test_run_command(self, invoke_cli, mock_service):
         """Test run command."""
-        mock_service = Mock()
-        mock_service_class.return_value = mock_service
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["run"])
-
-        assert result.exit_code == 0
+        assert invoke_cli(["run"]) == 0
         mock_service.run.assert_called_once()
 
-    @patch("src.transcript_service.TranscriptService")
-    def test_run_command_keyboard_interrupt(self, mock_service_class):
-        """Test run command with keyboard interrupt."""
-        mock_service = Mock()
-        mock_service.run.side_effect = KeyboardInterrupt()
-        mock_service_class.return_value = mock_service
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["run"])
-
-        assert result.exit_code == 0
-        assert "interrupted" in result.output
-
-    @patch("src.transcript_service.TranscriptService")
-    def test_run_command_exception(self, mock_service_class):
-        """Test run command with exception."""
-        mock_service = Mock()
-        mock_service.run.side_effect = Exception("Service error")
-        mock_service_class.return_value = mock_service
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["run"])
-
-        assert result.exit_code == 1
-        assert "Service error" in result.output
-
-    @patch("src.transcript_service.TranscriptService")
-    def test_status_command(self, mock_service_class):
+    def test_status_command(self, invoke_cli, capsys, mock_service):
         """Test status command."""
-        mock_service = Mock()
-        mock_service.get_status.return_value = {
-            "running": True,
-            "config_loaded": True,
-            "transcriber_initialized": True,
-            "monitor_active": True,
-            "directories": {
-                "input": "/test/input",
-                "output": "/test/output",
-                "done": "/test/done",
-            },
-            "statistics": {
-                "total_processed": 10,
-                "successful": 8,
-                "errors": 2,
-                "skipped": 0,
-                "success_rate": 0.8,
-            },
-        }
-        mock_service_class.return_value = mock_service
+        mock_service.get_status.return_value = STATUS_FIXTURE
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["status"])
-
-        assert result.exit_code == 0
-        assert "Running: True" in result.output
-        assert "Total processed: 10" in result.output
-        assert "Success rate: 80.0%" in result.output
+        assert invoke_cli(["status"]) == 0
+        output = capsys.readouterr().out
 
-    @patch("src.transcript_service.TranscriptService")
-    def test_status_command_exception(self, mock_service_class):
-        """Test status command with exception."""
-        mock_service_class.side_effect = Exception("Status error")
+        assert "Running: True" in output
+        assert "Total processed: 10" in output
+        assert "Success rate: 80.0%" in output
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["status"])
-
-        assert result.exit_code == 1
-        assert "Status check failed" in result.output
-
-    @patch("src.transcript_service.TranscriptService")
-    def test_transcribe_command(self, mock_service_class, tmp_path):
+    def test_transcribe_command(self, runner, mock_service, fake_audio):
         """Test transcribe command."""
-        # Create test audio file
-        audio_file = tmp_path / "test.mp3"
-        audio_file.write_text("fake audio")
-
-        mock_service = Mock()
-        mock_service.transcriber = Mock()
-        mock_service.transcriber.transcribe_and_save.return_value = {
-            "status": "success",
-            "duration_seconds": 5.2,
-            "transcript_length": 150,
-            "output_file": str(tmp_path / "test.txt"),
-        }
-        mock_service_class.return_value = mock_service
+        mock_service.transcriber.transcribe_and_save.return_value = (
+            TRANSCRIBE_SUCCESS_RESULT
+        )
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["transcribe", str(audio_file)])
+        result = runner.invoke(cli, ["transcribe", fake_audio], catch_exceptions=False)
 
         assert result.exit_code == 0
+        mock_service.transcriber.transcribe_and_save.assert_called_once_with(
+            Path(fake_audio), Path("/fake/test.txt")
+        )
         assert "Transcription completed successfully" in result.output
         assert "Duration: 5.2s" in result.output
         assert "150 characters" in result.output
 
-    @patch("src.transcript_service.TranscriptService")
-    def test_transcribe_command_with_output(self, mock_service_class, tmp_path):
+    def test_transcribe_command_with_output(self, runner, mock_service, fake_audio):
         """Test transcribe command with specified output file."""
-        audio_file = tmp_path / "test.mp3"
-        audio_file.write_text("fake audio")
-        output_file = tmp_path / "custom_output.txt"
+        output_file = "/fake/custom_output.txt"
 
-        mock_service = Mock()
-        mock_service.transcriber = Mock()
         mock_service.transcriber.transcribe_and_save.return_value = {
-            "status": "success",
-            "duration_seconds": 3.1,
-            "transcript_length": 100,
-            "output_file": str(output_file),
+            **TRANSCRIBE_SUCCESS_RESULT,
+            "output_file": output_file,
         }
-        mock_service_class.return_value = mock_service
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["transcribe", str(audio_file), str(output_file)])
+        result = runner.invoke(
+            cli, ["transcribe", fake_audio, output_file], catch_exceptions=False
+        )
 
         assert result.exit_code == 0
         assert "Transcription completed successfully" in result.output
 
-    @patch("src.transcript_service.TranscriptService")
-    def test_transcribe_command_failure(self, mock_service_class, tmp_path):
-        """Test transcribe command with failure."""
-        audio_file = tmp_path / "test.mp3"
-        audio_file.write_text("fake audio")
-
-        mock_service = Mock()
-        mock_service.transcriber = Mock()
-        mock_service.transcriber.transcribe_and_save.return_value = {
-            "status": "error",
-            "error": "API quota exceeded",
-        }
-        mock_service_class.return_value = mock_service
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["transcribe", str(audio_file)])
-
-        assert result.exit_code == 1
-        assert "Transcription failed" in result.output
-        assert "API quota exceeded" in result.output
-
-    @patch("src.transcript_service.TranscriptService")
-    def test_transcribe_command_exception(self, mock_service_class, tmp_path):
-        """Test transcribe command with exception."""
-        audio_file = tmp_path / "test.mp3"
-        audio_file.write_text("fake audio")
-
-        mock_service_class.side_effect = Exception("Transcribe error")
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["transcribe", str(audio_file)])
-
-        assert result.exit_code == 1
-        assert "Transcription failed" in result.output
-
-    @patch("src.config.create_sample_config")
-    @patch("src.config.get_default_config_path")
-    def test_init_config_command(self, mock_get_path, mock_create_config):
+    def test_init_config_command(
+        self, invoke_cli, capsys, mock_get_path, mock_create_config
+    ):
         """Test init-config command."""
-        mock_path = Path("/test/.env")
+        mock_path = MagicMock(spec=Path)
+        mock_path.exists.return_value = False
+        mock_path.__str__.return_value = "/test/.env"
         mock_get_path.return_value = mock_path
-        mock_path.exists = Mock(return_value=False)
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["init-config"])
+        assert invoke_cli(["init-config"]) == 0
 
-        assert result.exit_code == 0
-        assert "Configuration file created" in result.output
+        assert "Configuration file created: /test/.env" in capsys.readouterr().out
         mock_create_config.assert_called_once_with(mock_path)
 
-    @patch("src.config.get_default_config_path")
-    def test_init_config_exists_no_force(self, mock_get_path):
+    def test_init_config_exists_no_force(self, invoke_cli, capsys, mock_get_path):
         """Test init-config when file exists without force."""
-        mock_path = Mock()
+        mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_get_path.return_value = mock_path
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["init-config"])
+        assert invoke_cli(["init-config"]) == 0
+        output = capsys.readouterr().out
 
-        assert result.exit_code == 0
-        assert "already exists" in result.output
-        assert "Use --force" in result.output
+        assert "already exists" in output
+        assert "Use --force" in output
 
-    @patch("src.config.create_sample_config")
-    @patch("src.config.get_default_config_path")
-    def test_init_config_force_overwrite(self, mock_get_path, mock_create_config):
+    def test_init_config_force_overwrite(
+        self, invoke_cli, capsys, mock_get_path, mock_create_config
+    ):
         """Test init-config with force overwrite."""
-        mock_path = Mock()
+        mock_path = Mock(spec=Path)
         mock_path.exists.return_value = True
         mock_get_path.return_value = mock_path
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["init-config", "--force"])
+        assert invoke_cli(["init-config", "--force"]) == 0
 
-        assert result.exit_code == 0
-        assert "Configuration file created" in result.output
+        assert "Configuration file created" in capsys.readouterr().out
         mock_create_config.assert_called_once_with(mock_path)
 
-    @patch("src.config.create_sample_config")
-    @patch("src.config.get_default_config_path")
-    def test_init_config_error(self, mock_get_path, mock_create_config):
-        """Test init-config with creation error."""
-        mock_path = Mock()
-        mock_path.exists.return_value = False
-        mock_get_path.return_value = mock_path
-        mock_create_config.side_effect = Exception("Creation failed")
+    @pytest.mark.parametrize(
+        "args, setup, expected_exit, expected_output",
+        [
+            pytest.param(
+                ["run"],
+                raise_from_run(KeyboardInterrupt()),
+                0,
+                "interrupted",
+                id="run-interrupted",
+            ),
+            pytest.param(
+                ["run"],
+                raise_from_run(Exception("Service error")),
+                1,
+                "Service error",
+                id="run-exception",
+            ),
+            pytest.param(
+                ["status"],
+                raise_from_service_init(Exception("Status error")),
+                1,
+                "Status check failed",
+                id="status-exception",
+            ),
+            pytest.param(
+                ["transcribe", AUDIO_ARG],
+                return_from_transcribe(TRANSCRIBE_ERROR_RESULT),
+                1,
+                "Transcription failed: API quota exceeded",
+                id="transcribe-failure",
+            ),
+            pytest.param(
+                ["transcribe", AUDIO_ARG],
+                raise_from_service_init(Exception("Transcribe error")),
+                1,
+                "Transcription failed",
+                id="transcribe-exception",
+            ),
+            pytest.param(
+                ["init-config"],
+                raise_from_create_config(Exception("Creation failed")),
+                1,
+                "Failed to create configuration",
+                id="init-config-error",
+            ),
+        ],
+    )
+    def test_cli_error_paths(
+        self,
+        runner,
+        mock_service_class,
+        mock_get_path,
+        mock_create_config,
+        fake_audio,
+        args,
+        setup,
+        expected_exit,
+        expected_output,
+    ):
+        """Test CLI commands report injected errors with the right exit code."""
+        mock_get_path.return_value.exists.return_value = False
+        setup(mock_service_class, mock_create_config)
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["init-config"])
+        args = [fake_audio if arg is AUDIO_ARG else arg for arg in args]
+        result = runner.invoke(cli, args)
 
-        assert result.exit_code == 1
-        assert "Failed to create configuration" in result.output
+        assert result.exit_code == expected_exit
+        assert expected_output in result.output
 
 
 class TestMainFunction:
     """Test the main entry point function."""
 
-    @patch("src.transcript_service.cli")
-    def test_main(self, mock_cli):
+    def test_main(self, mocker):
         """Test main function calls cli."""
+        mock_cli = mocker.patch("src.transcript_service.cli")
+
         main()
         mock_cli.assert_called_once()
 
@@ -377,30 +457,14 @@ class TestMainFunction:
 class TestServiceSignalHandling:
     """Test signal handling in the service."""
 
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_signal_handler_sigterm(self, mock_setup_logging, mock_load_config):
-        """Test SIGTERM signal handling."""
-        mock_config = Mock()
-        mock_load_config.return_value = mock_config
-
-        service = TranscriptService()
-        service.running = True
-
-        # Test SIGTERM
-        service._signal_handler(signal.SIGTERM, None)
-        assert service.running is False
-
-    @patch("src.transcript_service.load_config")
-    @patch("src.transcript_service.setup_logging")
-    def test_signal_handler_unknown(self, mock_setup_logging, mock_load_config):
-        """Test unknown signal handling."""
-        mock_config = Mock()
-        mock_load_config.return_value = mock_config
-
-        service = TranscriptService()
+    @pytest.mark.parametrize(
+        "sig",
+        [signal.SIGTERM, signal.SIGINT, 999],
+        ids=["SIGTERM", "SIGINT", "unknown"],
+    )
+    def test_signal_handler(self, service, sig):
+        """Test that any received signal stops the service."""
         service.running = True
 
-        # Test unknown signal
-        service._signal_handler(999, None)
+        service._signal_handler(sig, None)
         assert service.running is False